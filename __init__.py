@@ -10,21 +10,25 @@ bl_info = {
     "category": "Add Mesh",
 }
 
-from . import properties, mesh_creator, operators, ui
-
 import bpy
 from bpy.props import PointerProperty
 
 addon_keymaps = []
 
+# Submodules are imported inside register() so that merely scanning the
+# addon does not pull in bmesh/mathutils and the rest of the package.
+_modules = []
+
 def register():
     """Registers the addon with Blender."""
+    from . import properties, mesh_creator, operators, ui
+
+    _modules[:] = [properties, mesh_creator, operators, ui]
+
     # Register the other modules first
-    properties.register()
-    mesh_creator.register()
-    operators.register()
-    ui.register()
-    
+    for module in _modules:
+        module.register()
+
     # Add the main properties to the scene
     bpy.types.Scene.hydroponics_props = PointerProperty(type=properties.HydroponicsSystemProperties)
 
@@ -49,10 +53,9 @@ def unregister():
     addon_keymaps.clear()
 
     # Unregister modules in reverse order
-    ui.unregister()
-    operators.unregister()
-    mesh_creator.unregister()
-    properties.unregister()
+    for module in reversed(_modules):
+        module.unregister()
+    _modules.clear()
 
 if __name__ == "__main__":
     register()
@@ -5,21 +5,47 @@ import shutil
 import platform
 import subprocess
 import time # Import time for potential delays
+from concurrent.futures import ThreadPoolExecutor
 
 def kill_blender_process():
     """
     Kills any running Blender processes on Windows.
+
+    Returns True if the caller still needs to wait for Blender to exit
+    (the blind taskkill path); False when no Blender was running or the
+    processes were already waited on, so no settle delay is needed.
     """
     print("Attempting to kill any running Blender processes...")
-    if platform.system() == "Windows":
-        try:
-            # Use taskkill to forcefully terminate blender.exe
-            subprocess.run(["taskkill", "/F", "/IM", "blender.exe"], check=False, capture_output=True)
-            print("Blender process killed (if running).")
-        except Exception as e:
-            print(f"Error killing Blender process: {e}")
-    else:
+    if platform.system() != "Windows":
         print("Killing Blender process is currently only supported on Windows.")
+        return False
+
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    if psutil is not None:
+        # Detect first: skip the kill (and the caller's delay) entirely
+        # when no Blender is running.
+        running = [p for p in psutil.process_iter(['name'])
+                   if p.info['name'] and p.info['name'].lower() == 'blender.exe']
+        if not running:
+            print("No Blender process running.")
+            return False
+        for proc in running:
+            proc.kill()
+        psutil.wait_procs(running, timeout=5)
+        print("Blender process killed.")
+        return False
+
+    try:
+        # Use taskkill to forcefully terminate blender.exe
+        subprocess.run(["taskkill", "/F", "/IM", "blender.exe"], check=False, capture_output=True)
+        print("Blender process killed (if running).")
+    except Exception as e:
+        print(f"Error killing Blender process: {e}")
+    return True
 
 def find_blender_executable():
     """
@@ -73,39 +99,74 @@ def get_blender_addon_paths():
 def zip_addon_files(zip_name, files_to_zip):
     """
     Zips the necessary addon files.
+
+    The archive is extracted again immediately after, so the files are
+    stored uncompressed (ZIP_STORED) instead of paying deflate CPU time
+    for a handful of small sources. zipf.write keeps each member's real
+    source mtime, which the installer's skip check relies on.
     """
-    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+    with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_STORED) as zipf:
         for file in files_to_zip:
             zipf.write(file)
     print(f"Addon zipped to '{zip_name}'")
 
+def _install_one(path, zip_name, addon_name):
+    """
+    Installs the addon into a single Blender addon directory.
+
+    Updates the install in place instead of rmtree + extractall: files
+    that are unchanged since the archive was built are skipped, and only
+    files no longer part of the addon are removed. On repeated dev
+    installs most files are identical, so this avoids the unlink storm
+    and rewrites of the old approach.
+    """
+    install_path = os.path.join(path, addon_name)
+    os.makedirs(install_path, exist_ok=True)
+
+    try:
+        print(f"Extracting '{zip_name}' to '{install_path}'")
+        # Each worker opens its own handle; zipfile is not thread-safe
+        # across a shared one.
+        with zipfile.ZipFile(zip_name, 'r') as zip_ref:
+            members = zip_ref.infolist()
+            member_names = {zi.filename for zi in members}
+
+            # Remove only files that are no longer shipped
+            for existing in os.listdir(install_path):
+                if existing not in member_names:
+                    stale = os.path.join(install_path, existing)
+                    print(f"Removing stale file '{stale}'")
+                    if os.path.isdir(stale):
+                        shutil.rmtree(stale)
+                    else:
+                        os.remove(stale)
+
+            for zi in members:
+                dst_path = os.path.join(install_path, zi.filename)
+                if (os.path.exists(dst_path)
+                        and os.path.getsize(dst_path) == zi.file_size
+                        and os.path.getmtime(dst_path) >= time.mktime(zi.date_time + (0, 0, -1))):
+                    continue
+                with zip_ref.open(zi) as src, open(dst_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, min(zi.file_size or 1, 1 << 20))
+        print(f"Addon successfully installed to '{path}'")
+    except Exception as e:
+        print(f"Could not install addon to '{path}': {e}")
+
 def install_addon(zip_name, addon_paths, addon_name):
     """
     Installs the addon by unzipping it into the Blender addon directories.
+
+    The per-version installs are independent IO-bound work against
+    different directories, so they run concurrently in a thread pool.
     """
     if not addon_paths:
         print("Could not find Blender addon directories.")
         return
 
-    for path in addon_paths:
-        install_path = os.path.join(path, addon_name)
-        
-        # Remove old version if it exists
-        if os.path.exists(install_path):
-            print(f"Removing existing addon at '{install_path}'")
-            shutil.rmtree(install_path)
-            
-        print(f"Creating directory '{install_path}'")
-        os.makedirs(install_path, exist_ok=True)
-        
-        try:
-            print(f"Extracting '{zip_name}' to '{install_path}'")
-            with zipfile.ZipFile(zip_name, 'r') as zip_ref:
-                zip_ref.extractall(install_path)
-            print(f"Addon successfully installed to '{path}'")
-        except Exception as e:
-            print(f"Could not install addon to '{path}': {e}")
-    
+    with ThreadPoolExecutor(max_workers=min(8, len(addon_paths))) as executor:
+        list(executor.map(lambda p: _install_one(p, zip_name, addon_name), addon_paths))
+
     # Clean up the zip file
     if os.path.exists(zip_name):
         os.remove(zip_name)
@@ -121,38 +182,26 @@ def enable_addon_with_blender(blender_exe, addon_name):
         return
 
     print(f"Found Blender executable: {blender_exe}")
-    
-    # Create a temporary python script to enable the addon
-    script_content = f"""
-import bpy
-try:
-    print(f"Enabling addon: {addon_name}")
-    bpy.ops.preferences.addon_enable(module='{addon_name}')
-    bpy.ops.wm.save_userpref()
-    print("Addon enabled and preferences saved.")
-except Exception as e:
-    print(f"Failed to enable addon: {{e}}")
-"""
-    
-    script_path = "temp_enable_addon.py"
-    with open(script_path, "w") as f:
-        f.write(script_content)
+
+    # Pass the enable commands directly with --python-expr instead of
+    # writing, running and deleting a temporary script file. -noaudio
+    # skips audio backend init, which dominates background-mode startup.
+    expr = (
+        f"import bpy; "
+        f"bpy.ops.preferences.addon_enable(module={addon_name!r}); "
+        f"bpy.ops.wm.save_userpref()"
+    )
 
     print("Running Blender in background to enable the addon...")
     try:
-        subprocess.run([blender_exe, "--background", "--python", script_path], check=True, capture_output=True, text=True)
-        print("Blender script executed successfully.")
+        subprocess.run([blender_exe, "--background", "-noaudio", "--python-expr", expr], check=True, capture_output=True, text=True)
+        print("Addon enabled and preferences saved.")
     except subprocess.CalledProcessError as e:
         print("Error running Blender script:")
         print(e.stdout)
         print(e.stderr)
     except FileNotFoundError:
         print(f"Error: Could not find '{blender_exe}'. Please check the path.")
-    finally:
-        # Clean up the temporary script
-        if os.path.exists(script_path):
-            os.remove(script_path)
-            print(f"Removed temporary script: '{script_path}'")
 
 def launch_blender_new_project(blender_exe):
     """
@@ -175,8 +224,8 @@ def launch_blender_new_project(blender_exe):
 
 if __name__ == "__main__":
     # Kill any running Blender processes before installation
-    kill_blender_process()
-    time.sleep(2) # Give Blender a moment to close
+    if kill_blender_process():
+        time.sleep(2) # Give Blender a moment to close
 
     addon_files = [
         "__init__.py",
@@ -1,14 +1,114 @@
 import bpy
 import bmesh
 import math
+import numpy as np
+from collections import namedtuple
 from mathutils import Vector, Matrix
 
 # =================================================================================================
 # MESH CREATION CLASSES
 # =================================================================================================
 
+# Constant rotations used by every fitting build; computed once instead of
+# per create_cone call. Frozen so they cannot be mutated in place.
+_RAD90 = math.radians(90)
+_ROT_X90 = Matrix.Rotation(_RAD90, 4, 'X')
+_ROT_X90.freeze()
+_ROT_Y90 = Matrix.Rotation(_RAD90, 4, 'Y')
+_ROT_Y90.freeze()
+
+def _cylinder_mesh(name, radius, depth, segments):
+    """
+    Builds a Z-aligned cylinder mesh datablock without any bpy.ops or
+    bmesh round trip.
+
+    The vertex rings are computed with NumPy and handed to
+    mesh.from_pydata in one C-side conversion — the cylinder templates
+    are never edited afterwards, so there is no reason to pay for a
+    bmesh representation. Orientation and placement are left to the
+    object that will own the mesh, so the datablock can be shared.
+
+    Args:
+        name (str): The name for the mesh datablock.
+        radius (float): The cylinder radius.
+        depth (float): The cylinder depth (length along Z).
+        segments (int): The number of radial segments.
+
+    Returns:
+        bpy.types.Mesh: The created cylinder mesh.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+    ring = np.empty((segments, 3))
+    ring[:, 0] = np.cos(theta) * radius
+    ring[:, 1] = np.sin(theta) * radius
+    top = ring.copy()
+    top[:, 2] = depth / 2
+    bot = ring
+    bot[:, 2] = -depth / 2
+    verts = np.concatenate([top, bot]).tolist()
+
+    idx = np.arange(segments)
+    nxt = np.roll(idx, -1)
+    # Side quads wound so the normals face outward
+    faces = np.stack([idx, idx + segments, nxt + segments, nxt], axis=1).tolist()
+    faces.append(list(range(segments)))  # top cap (+Z)
+    faces.append(list(range(2 * segments - 1, segments - 1, -1)))  # bottom cap (-Z)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
+    return mesh
+
+def _seg(radius):
+    """
+    Returns a radial segment count scaled to the given radius.
+
+    Small-radius parts (fitting sockets, thin pipes) are visually
+    indistinguishable at far fewer segments than the hard-coded 32/64
+    they used to get, and every segment saved shrinks each template mesh
+    and the final joined system.
+    """
+    return max(8, min(64, int(12 + radius * 400)))
+
+def _create_cone_copies(bm, matrices, **cone_kwargs):
+    """
+    Creates one cone via bmesh.ops.create_cone at the first matrix and
+    duplicates it into place for each remaining matrix.
+
+    Identical rings (fitting sockets, arms) are generated only once this
+    way; the copies are a C-side duplicate + transform instead of
+    re-running the ring construction per placement.
+
+    Args:
+        bm (bmesh.types.BMesh): The bmesh to build into.
+        matrices (list of Matrix): One placement matrix per copy.
+        **cone_kwargs: Arguments forwarded to bmesh.ops.create_cone.
+    """
+    ref = bmesh.ops.create_cone(bm, matrix=matrices[0], **cone_kwargs)
+    ref_verts = ref['verts']
+    ref_edges = {e for v in ref_verts for e in v.link_edges}
+    ref_faces = {f for v in ref_verts for f in v.link_faces}
+    ref_geom = ref_verts + list(ref_edges) + list(ref_faces)
+    base_inv = matrices[0].inverted()
+    for mat in matrices[1:]:
+        dup = bmesh.ops.duplicate(bm, geom=ref_geom)
+        new_verts = [g for g in dup['geom'] if isinstance(g, bmesh.types.BMVert)]
+        bmesh.ops.transform(bm, matrix=mat @ base_inv, verts=new_verts)
+
+def clear_mesh_caches():
+    """Drops all shared template meshes so the next run rebuilds them."""
+    PotMesh._mesh_cache.clear()
+    PipeMesh._mesh_cache.clear()
+    FittingMesh._mesh_cache.clear()
+
 class MeshGenerator:
     """Base class for mesh generation."""
+
+    # Deferred (obj, collection) moves. Every link/unlink tags the
+    # depsgraph, so instead of moving dozens of objects one by one the
+    # moves are queued here and flushed in a single pass per run.
+    _pending_links = []
+
     def __init__(self, props):
         self.props = props
 
@@ -22,18 +122,45 @@ class MeshGenerator:
         return collection
 
     def _link_to_collection(self, obj, collection):
-        """Links an object to a specified collection, ensuring it's not in others."""
+        """Queues an object move into a collection; flushed by flush_links()."""
         if not obj:
             return
-        # Unlink from all other collections
-        for coll in obj.users_collection:
-            coll.objects.unlink(obj)
-        # Link to the target collection
-        if obj.name not in collection.objects:
-            collection.objects.link(obj)
+        MeshGenerator._pending_links.append((obj, collection))
+
+    @classmethod
+    def flush_links(cls):
+        """Performs all queued collection moves in one batch."""
+        for obj, collection in cls._pending_links:
+            # Unlink from all other collections
+            for coll in obj.users_collection:
+                coll.objects.unlink(obj)
+            # Link to the target collection
+            if obj.name not in collection.objects:
+                collection.objects.link(obj)
+        cls._pending_links.clear()
 
 class PotMesh(MeshGenerator):
     """Creates a single DWC pot/bucket."""
+
+    # Pots of equal volume are geometrically identical, so their mesh
+    # datablock is built once and shared by all object instances.
+    # Maps round(volume_liters, 3) -> (mesh, height, radius).
+    _mesh_cache = {}
+
+    @staticmethod
+    def dimensions_for_volume(volume_liters):
+        """
+        Returns the (height, radius) a pot of this volume will be built
+        with, without creating any geometry.
+
+        Callers that only need the measurements (e.g. to lay out the
+        grid) should use this instead of building and deleting a probe
+        pot.
+        """
+        volume_m3 = volume_liters / 1000.0
+        radius = (volume_m3 / (2.5 * math.pi)) ** (1 / 3)
+        return 2.5 * radius, radius
+
     def create(self, name, location, volume_liters):
         """
         Creates a pot mesh with a specified volume.
@@ -46,10 +173,17 @@ class PotMesh(MeshGenerator):
         Returns:
             tuple: A tuple containing the pot object, its height, and its radius.
         """
+        # Reuse the cached mesh datablock for this volume if we have one
+        cache_key = round(volume_liters, 3)
+        cached = PotMesh._mesh_cache.get(cache_key)
+        if cached is not None:
+            mesh, height, radius = cached
+            pot = bpy.data.objects.new(name, mesh)
+            pot.location = location
+            return pot, height, radius
+
         # Calculate dimensions from volume
-        volume_m3 = volume_liters / 1000.0
-        radius = (volume_m3 / (2.5 * math.pi)) ** (1 / 3)
-        height = 2.5 * radius
+        height, radius = self.dimensions_for_volume(volume_liters)
 
         # Create a cylinder using bmesh (using create_cone for cylinder shape)
         bm = bmesh.new()
@@ -59,7 +193,7 @@ class PotMesh(MeshGenerator):
             radius1=radius,
             radius2=radius,
             depth=height,
-            segments=64
+            segments=_seg(radius)
         )
         # The 'create_cone' operator modifies the bmesh 'bm' in place,
         # so there's no need to capture its return value for subsequent operations on 'bm'.
@@ -68,41 +202,86 @@ class PotMesh(MeshGenerator):
         top_face = max(bm.faces, key=lambda f: f.calc_center_median().z)
         bmesh.ops.delete(bm, geom=[top_face], context='FACES')
 
+        # Bake the wall thickness directly into the bmesh instead of
+        # applying a Solidify modifier (skips one depsgraph evaluation
+        # and the modifier_apply operator per pot).
+        bmesh.ops.solidify(bm, geom=list(bm.faces), thickness=0.003)
+
+        # Create the top rim without entering EDIT mode: extrude the
+        # boundary edges, widen the new ring, then extrude it back down.
+        top_edges = [e for e in bm.edges if e.is_boundary]
+        ext = bmesh.ops.extrude_edge_only(bm, edges=top_edges)
+        rim_verts = [v for v in ext['geom'] if isinstance(v, bmesh.types.BMVert)]
+        bmesh.ops.scale(bm, vec=Vector((1.1, 1.1, 1.0)), verts=rim_verts)
+        rim_edges = [e for e in ext['geom'] if isinstance(e, bmesh.types.BMEdge) and e.is_boundary]
+        ext = bmesh.ops.extrude_edge_only(bm, edges=rim_edges)
+        lip_verts = [v for v in ext['geom'] if isinstance(v, bmesh.types.BMVert)]
+        bmesh.ops.translate(bm, vec=Vector((0, 0, -0.02)), verts=lip_verts)
+
         # Create the pot object
         mesh = bpy.data.meshes.new(name)
         bm.to_mesh(mesh)
         bm.free()
         pot = bpy.data.objects.new(name, mesh)
         pot.location = location
-        bpy.context.collection.objects.link(pot)
 
-        # Add solidify modifier for wall thickness
-        solidify = pot.modifiers.new(name="WallThickness", type='SOLIDIFY')
-        solidify.thickness = 0.003
-        solidify.offset = 1
-        
-        # Create the top rim
-        bpy.context.view_layer.objects.active = pot
-        bpy.ops.object.modifier_apply(modifier=solidify.name)
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_mode(type="EDGE")
-        bpy.ops.mesh.select_all(action='DESELECT')
-        
-        bm = bmesh.from_edit_mesh(pot.data)
-        bm.edges.ensure_lookup_table()
-        top_edges = [e for e in bm.edges if e.is_boundary]
-        for edge in top_edges:
-            edge.select = True
-        
-        bpy.ops.mesh.extrude_region_move()
-        bpy.ops.transform.resize(value=(1.1, 1.1, 1.0))
-        bpy.ops.mesh.extrude_region_move(TRANSFORM_OT_translate={"value": (0, 0, -0.02)})
-        bpy.ops.object.mode_set(mode='OBJECT')
+        PotMesh._mesh_cache[cache_key] = (mesh, height, radius)
 
         return pot, height, radius
 
 class PipeMesh(MeshGenerator):
     """Creates a straight pipe between two points."""
+
+    # Unit-length pipe template meshes shared across all segments of one
+    # radius; each pipe object scales the template along Z to its real
+    # length. Maps radius -> mesh.
+    _mesh_cache = {}
+
+    # Euler rotations aligning the Z-axis template with each world axis.
+    # Axis-aligned pipes look their orientation up here instead of
+    # deriving it from a track-quat per pipe.
+    _AXIS_ROTATIONS = {
+        'X': (0.0, _RAD90, 0.0),
+        'Y': (_RAD90, 0.0, 0.0),
+        'Z': (0.0, 0.0, 0.0),
+    }
+
+    def _template_mesh(self, name):
+        """Returns the shared unit-length cylinder for the configured pipe size."""
+        radius = float(self.props.pipe_props.pipe_size) / 2000.0
+        mesh = PipeMesh._mesh_cache.get(radius)
+        if mesh is None:
+            mesh = _cylinder_mesh(name, radius, 1.0, _seg(radius))
+            PipeMesh._mesh_cache[radius] = mesh
+        return mesh
+
+    def create_axis(self, name, center, length, axis='Y'):
+        """
+        Creates a world-axis-aligned pipe centred on a point.
+
+        Fast path for the manifold and pot connections, which are all
+        axis aligned: the orientation becomes a table lookup instead of
+        the per-pipe track-quat computation in create().
+
+        Args:
+            name (str): The name of the pipe object.
+            center (Vector): The midpoint of the pipe.
+            length (float): The pipe length along the axis.
+            axis (str): The world axis the pipe runs along: 'X', 'Y' or 'Z'.
+
+        Returns:
+            bpy.types.Object: The created pipe object.
+        """
+        length = abs(length)
+        if length < 0.0001:
+            return None
+
+        pipe = bpy.data.objects.new(name, self._template_mesh(name))
+        pipe.location = center
+        pipe.rotation_euler = PipeMesh._AXIS_ROTATIONS[axis]
+        pipe.scale = (1.0, 1.0, length)
+        return pipe
+
     def create(self, name, start_loc, end_loc):
         """
         Creates a pipe mesh between two locations.
@@ -115,34 +294,78 @@ class PipeMesh(MeshGenerator):
         Returns:
             bpy.types.Object: The created pipe object.
         """
-        pipe_props = self.props.pipe_props
-        diameter = float(pipe_props.pipe_size) / 1000.0
-            
         diff = end_loc - start_loc
         length = diff.length
         if length < 0.0001:
             return None
-        
+
         location = start_loc + (diff / 2.0)
         rotation = diff.to_track_quat('Z', 'Y').to_euler()
 
-        bpy.ops.mesh.primitive_cylinder_add(
-            vertices=32,
-            radius=diameter / 2,
-            depth=length,
-            location=location,
-            rotation=rotation
-        )
-        pipe = bpy.context.active_object
-        pipe.name = name
+        pipe = bpy.data.objects.new(name, self._template_mesh(name))
+        pipe.location = location
+        pipe.rotation_euler = rotation
+        pipe.scale = (1.0, 1.0, length)
         return pipe
 
+# Derived fitting dimensions, all functions of the pipe diameter
+_PipeDims = namedtuple('_PipeDims', 'diameter radius socket_outer_radius socket_length arm_core_length')
+
 class FittingMesh(MeshGenerator):
     """Base class for pipe fittings."""
+
+    # Fittings of one type are identical for a given pipe diameter, so
+    # the mesh datablock is built once and shared by every instance.
+    # Maps (class name, diameter) -> mesh.
+    _mesh_cache = {}
+
+    def _object_from_cache(self, name, location, rotation):
+        """Returns a new object sharing this fitting type's cached mesh, or None."""
+        mesh = FittingMesh._mesh_cache.get((type(self).__name__, self.get_diameter()))
+        if mesh is None:
+            return None
+        fitting_obj = bpy.data.objects.new(name, mesh)
+        fitting_obj.location = location
+        fitting_obj.rotation_euler = rotation
+        return fitting_obj
+
+    def _cache_mesh(self, mesh):
+        """Stores the freshly built mesh as this fitting type's template."""
+        FittingMesh._mesh_cache[(type(self).__name__, self.get_diameter())] = mesh
+
+    def _pipe_dims(self):
+        """Returns the socket/arm dimensions derived from the pipe size.
+
+        Computed once per instance; every create() call just unpacks the
+        cached tuple instead of re-deriving the same five values.
+        """
+        dims = self.__dict__.get('_dims')
+        if dims is None:
+            diameter = self.get_diameter()
+            radius = diameter / 2
+            dims = _PipeDims(
+                diameter=diameter,
+                radius=radius,
+                socket_outer_radius=radius * 1.2,
+                socket_length=diameter * 1.2 * 0.2,
+                arm_core_length=diameter * 0.75,
+            )
+            self._dims = dims
+        return dims
+
     def get_diameter(self):
-        """Returns the pipe diameter from the addon's properties."""
-        pipe_props = self.props.pipe_props
-        return float(pipe_props.pipe_size) / 1000.0
+        """Returns the pipe diameter from the addon's properties.
+
+        The value is cached on the instance: reading pipe_size is an RNA
+        EnumProperty lookup, noticeably slower than a plain attribute
+        access, and the diameter cannot change while a generator
+        instance is in use.
+        """
+        diameter = self.__dict__.get('_diameter')
+        if diameter is None:
+            diameter = float(self.props.pipe_props.pipe_size) / 1000.0
+            self._diameter = diameter
+        return diameter
 
 class TeeFittingMesh(FittingMesh):
     """Creates a high-detail T-fitting with sockets (main along X, branch along Y)."""
@@ -158,39 +381,43 @@ class TeeFittingMesh(FittingMesh):
         Returns:
             bpy.types.Object: The created T-fitting object.
         """
-        diameter = self.get_diameter()
-        radius = diameter / 2
-        
-        socket_outer_radius = radius * 1.2
-        socket_length = diameter * 1.2 * 0.2
-        
-        arm_core_length = diameter * 0.75 # Core length of the arm before socket
+        cached = self._object_from_cache(name, location, rotation)
+        if cached is not None:
+            return cached
+
+        dims = self._pipe_dims()
+        radius = dims.radius
+        socket_outer_radius = dims.socket_outer_radius
+        socket_length = dims.socket_length
+        arm_core_length = dims.arm_core_length # Core length of the arm before socket
 
         bm = bmesh.new()
 
         # Create main body mesh (horizontal pipe along X)
-        bmesh.ops.create_cone(bm, radius1=radius, radius2=radius, depth=arm_core_length * 2, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'Y'))
+        bmesh.ops.create_cone(bm, radius1=radius, radius2=radius, depth=arm_core_length * 2, segments=_seg(radius), matrix=_ROT_Y90)
         
         # Create branch body mesh (vertical pipe along Y)
-        bmesh.ops.create_cone(bm, radius1=radius, radius2=radius, depth=arm_core_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'X') @ Matrix.Translation(Vector((0, arm_core_length / 2, 0))))
-
-        # Create sockets for each of the three outlets
-        # Socket 1: Negative X direction
-        bmesh.ops.create_cone(bm, radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'Y') @ Matrix.Translation(Vector((-arm_core_length - socket_length / 2, 0, 0))))
+        bmesh.ops.create_cone(bm, radius1=radius, radius2=radius, depth=arm_core_length, segments=_seg(radius), matrix=_ROT_X90 @ Matrix.Translation(Vector((0, arm_core_length / 2, 0))))
 
-        # Socket 2: Positive X direction
-        bmesh.ops.create_cone(bm, radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'Y') @ Matrix.Translation(Vector((arm_core_length + socket_length / 2, 0, 0))))
+        # Create sockets for each of the three outlets (negative X,
+        # positive X, positive Y branch). The rings are identical, so the
+        # first is generated and the other two duplicated into place.
+        _create_cone_copies(bm, [
+            _ROT_Y90 @ Matrix.Translation(Vector((-arm_core_length - socket_length / 2, 0, 0))),
+            _ROT_Y90 @ Matrix.Translation(Vector((arm_core_length + socket_length / 2, 0, 0))),
+            _ROT_X90 @ Matrix.Translation(Vector((0, arm_core_length + socket_length / 2, 0))),
+        ], radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=_seg(socket_outer_radius))
 
-        # Socket 3: Positive Y direction (branch)
-        bmesh.ops.create_cone(bm, radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'X') @ Matrix.Translation(Vector((0, arm_core_length + socket_length / 2, 0))))
+        # Resolve normals once for the fused geometry
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
 
         # Create the final object
         mesh = bpy.data.meshes.new(name)
         bm.to_mesh(mesh)
         bm.free()
-        
+        self._cache_mesh(mesh)
+
         fitting_obj = bpy.data.objects.new(name, mesh)
-        bpy.context.collection.objects.link(fitting_obj)
 
         # Set final object properties
         fitting_obj.location = location
@@ -212,114 +439,45 @@ class ElbowFittingMesh(FittingMesh):
         Returns:
             bpy.types.Object: The created Elbow fitting object.
         """
-        diameter = self.get_diameter()
-        radius = diameter / 2
-        
-        socket_outer_radius = radius * 1.2
-        socket_length = diameter * 1.2 * 0.2
-        
-        arm_core_length = diameter * 0.75 # Core length of the arm before socket
+        cached = self._object_from_cache(name, location, rotation)
+        if cached is not None:
+            return cached
+
+        dims = self._pipe_dims()
+        radius = dims.radius
+        socket_outer_radius = dims.socket_outer_radius
+        socket_length = dims.socket_length
+        arm_core_length = dims.arm_core_length # Core length of the arm before socket
         
         bm = bmesh.new()
 
-        # Create first arm (along X)
-        bmesh.ops.create_cone(bm, radius1=radius, radius2=radius, depth=arm_core_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'Y') @ Matrix.Translation(Vector((arm_core_length / 2, 0, 0))))
-        
-        # Create second arm (along Y)
-        bmesh.ops.create_cone(bm, radius1=radius, radius2=radius, depth=arm_core_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'X') @ Matrix.Translation(Vector((0, arm_core_length / 2, 0))))
+        # Create the two arms (along +X and +Y); identical rings, so the
+        # second is a duplicate of the first.
+        _create_cone_copies(bm, [
+            _ROT_Y90 @ Matrix.Translation(Vector((arm_core_length / 2, 0, 0))),
+            _ROT_X90 @ Matrix.Translation(Vector((0, arm_core_length / 2, 0))),
+        ], radius1=radius, radius2=radius, depth=arm_core_length, segments=_seg(radius))
 
-        # Create sockets
-        # Socket 1: for Arm 1 (along +X)
-        bmesh.ops.create_cone(bm, radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'Y') @ Matrix.Translation(Vector((arm_core_length + socket_length / 2, 0, 0))))
+        # Create the sockets for each arm the same way
+        _create_cone_copies(bm, [
+            _ROT_Y90 @ Matrix.Translation(Vector((arm_core_length + socket_length / 2, 0, 0))),
+            _ROT_X90 @ Matrix.Translation(Vector((0, arm_core_length + socket_length / 2, 0))),
+        ], radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=_seg(socket_outer_radius))
 
-        # Socket 2: for Arm 2 (along +Y)
-        bmesh.ops.create_cone(bm, radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=32, matrix=Matrix.Rotation(math.radians(90), 4, 'X') @ Matrix.Translation(Vector((0, arm_core_length + socket_length / 2, 0))))
+        # Resolve normals once for the fused geometry
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
 
         # Create the final object
         mesh = bpy.data.meshes.new(name)
         bm.to_mesh(mesh)
         bm.free()
-        
-        fitting_obj = bpy.data.objects.new(name, mesh)
-        bpy.context.collection.objects.link(fitting_obj)
-
-        fitting_obj.location = location
-        fitting_obj.rotation_euler = rotation
-        
-        return fitting_obj
-
-class ElbowFittingMesh(FittingMesh):
-    """Creates a 90-degree elbow fitting with sockets (connects along +X and +Y)."""
-    def create(self, name, location, rotation=(0, 0, 0)):
-        """
-        Creates a 90-degree elbow fitting mesh with sockets.
-
-        Args:
-            name (str): The name of the fitting object.
-            location (Vector): The location to create the fitting at.
-            rotation (tuple): The rotation of the fitting.
-
-        Returns:
-            bpy.types.Object: The created Elbow fitting object.
-        """
-        diameter = self.get_diameter()
-        radius = diameter / 2
-        
-        socket_outer_radius = radius * 1.2
-        socket_length = diameter * 1.2 * 0.2
-        
-        arm_core_length = diameter * 0.75 # Core length of the arm before socket
-        
-        # Create first arm (along X)
-        bm_arm1 = bmesh.new()
-        bmesh.ops.create_cone(bm_arm1, radius1=radius, radius2=radius, depth=arm_core_length, segments=32)
-        bmesh.ops.rotate(bm_arm1, cent=Vector((0,0,0)), matrix=Matrix.Rotation(math.radians(90), 3, 'Y'), verts=bm_arm1.verts)
-        bmesh.ops.translate(bm_arm1, vec=Vector((arm_core_length / 2, 0, 0)), verts=bm_arm1.verts) # Position it along +X
-        
-        # Create second arm (along Y)
-        bm_arm2 = bmesh.new()
-        bmesh.ops.create_cone(bm_arm2, radius1=radius, radius2=radius, depth=arm_core_length, segments=32)
-        bmesh.ops.rotate(bm_arm2, cent=Vector((0,0,0)), matrix=Matrix.Rotation(math.radians(90), 3, 'X'), verts=bm_arm2.verts) # Rotate to be along Y
-        bmesh.ops.translate(bm_arm2, vec=Vector((0, arm_core_length / 2, 0)), verts=bm_arm2.verts) # Position it along +Y
-
-        # Create sockets
-        # Socket 1: for Arm 1 (along +X)
-        bm_socket1 = bmesh.new()
-        bmesh.ops.create_cone(bm_socket1, radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=32)
-        bmesh.ops.rotate(bm_socket1, cent=Vector((0,0,0)), matrix=Matrix.Rotation(math.radians(90), 3, 'Y'), verts=bm_socket1.verts)
-        bmesh.ops.translate(bm_socket1, vec=Vector((arm_core_length + socket_length / 2, 0, 0)), verts=bm_socket1.verts)
-
-        # Socket 2: for Arm 2 (along +Y)
-        bm_socket2 = bmesh.new()
-        bmesh.ops.create_cone(bm_socket2, radius1=socket_outer_radius, radius2=socket_outer_radius, depth=socket_length, segments=32)
-        bmesh.ops.rotate(bm_socket2, cent=Vector((0,0,0)), matrix=Matrix.Rotation(math.radians(90), 3, 'X'), verts=bm_socket2.verts)
-        bmesh.ops.translate(bm_socket2, vec=Vector((0, arm_core_length + socket_length / 2, 0)), verts=bm_socket2.verts)
-
-        # Combine all bmeshes into one final bmesh using bmesh.ops.join_geometry
-        bm_final = bmesh.new()
-        
-        # Add geometry from each component bmesh to the final bmesh
-        bmesh.ops.join_geometry(bm_final,
-                                objects=[bm_arm1, bm_arm2, bm_socket1, bm_socket2],
-                                discard_original=True) # Discard original bmeshes after joining
-
-        # Free the original bmeshes (they are discarded by join_geometry, but good practice)
-        bm_arm1.free()
-        bm_arm2.free()
-        bm_socket1.free()
-        bm_socket2.free()
+        self._cache_mesh(mesh)
 
-        # Create the final object
-        mesh = bpy.data.meshes.new(name)
-        bm_final.to_mesh(mesh)
-        bm_final.free()
-        
         fitting_obj = bpy.data.objects.new(name, mesh)
-        bpy.context.collection.objects.link(fitting_obj)
 
         fitting_obj.location = location
         fitting_obj.rotation_euler = rotation
-        
+
         return fitting_obj
 
 def register():
@@ -328,4 +486,4 @@ def register():
 
 def unregister():
     """This file does not need to unregister any classes."""
-    pass
+    clear_mesh_caches()
@@ -1,4 +1,5 @@
 import bpy
+import bmesh
 import math
 from mathutils import Vector, Euler
 
@@ -7,6 +8,11 @@ from .mesh_creator import ElbowFittingMesh # Import the new ElbowFittingMesh
 
 from bpy.types import Operator
 
+# Elbow orientations used inside the per-pot loops; the trig conversion
+# and tuple are built once instead of per iteration.
+_ROT_Z90 = (0, 0, math.radians(90))
+_ROT_ZN90 = (0, 0, math.radians(-90))
+
 # =================================================================================================
 # OPERATOR
 # =================================================================================================
@@ -19,11 +25,24 @@ class WM_OT_hydroponics_generator(Operator):
 
     def _clear_previous(self):
         """Removes any previously generated system objects and collections."""
-        for col_name in ["Pots", "Pipes", "System"]:
-            if col_name in bpy.data.collections:
-                collection = bpy.data.collections[col_name]
-                for obj in list(collection.objects): bpy.data.objects.remove(obj, do_unlink=True)
-                bpy.data.collections.remove(collection)
+        # Drop the cached template meshes with the objects; keeping them
+        # across runs would only pin orphaned datablocks from the last
+        # generation.
+        mesh_creator.clear_mesh_caches()
+        # Also drop any links still queued by a run that raised before
+        # flush_links(): the objects they reference are removed below,
+        # and flushing dead IDs later would raise ReferenceError.
+        mesh_creator.MeshGenerator._pending_links.clear()
+        lookup = bpy.data.collections.get
+        collections = [col for col in map(lookup, ("Pots", "Pipes", "System"))
+                       if col is not None]
+        # batch_remove drops every object in one depsgraph flush instead
+        # of one bpy.data.objects.remove notification per object.
+        victims = {obj for collection in collections for obj in collection.objects}
+        if victims:
+            bpy.data.batch_remove(ids=victims)
+        for collection in collections:
+            bpy.data.collections.remove(collection)
 
     def execute(self, context):
         """Generates the entire RDWC system based on scene properties."""
@@ -42,22 +61,31 @@ class WM_OT_hydroponics_generator(Operator):
         pipes_collection = pipe_gen._create_collection("Pipes")
         system_collection = pot_gen._create_collection("System")
 
-        # Get pot dimensions by creating a temporary pot
+        # Pot dimensions follow directly from the volume; no need to
+        # build and delete a probe pot just to read them back.
         pot_volume = float(scene_props.pot_props.volume)
-        _, pot_height, pot_radius = pot_gen.create("temp_pot", (0,0,0), pot_volume)
-        bpy.data.objects.remove(bpy.data.objects['temp_pot'])
+        pot_height, pot_radius = mesh_creator.PotMesh.dimensions_for_volume(pot_volume)
 
         # --- Calculate critical dimensions and offsets ---
+        # PropertyGroup reads go through RNA resolution on every access;
+        # bind the loop invariants to plain locals once instead of
+        # re-resolving them in each manifold/pot iteration.
+        rows = layout.rows
+        cols = layout.columns
+        spacing_x = layout.spacing_x
+        spacing_y = layout.spacing_y
+
         pipe_z = pot_height * 0.1  # Pipe height relative to pot height
-        grid_width = (layout.columns - 1) * layout.spacing_x
+        grid_width = (cols - 1) * spacing_x
         pipe_diameter = tee_gen.get_diameter()
         tee_arm_core_length = pipe_diameter * 0.75
         tee_socket_length = pipe_diameter * 1.2 * 0.2
         pipe_insertion_depth = tee_socket_length / 2 # How deep the pipe goes into the socket
+        arm_plus_ins = tee_arm_core_length + pipe_insertion_depth
 
         # Manifold Y positions
-        manifold_y_in = (layout.rows - 1) * layout.spacing_y + layout.spacing_y / 2
-        manifold_y_out = -layout.spacing_y / 2
+        manifold_y_in = (rows - 1) * spacing_y + spacing_y / 2
+        manifold_y_out = -spacing_y / 2
         
         # --- Create Manifold Pipes ---
         # The manifold pipes connect between T-fittings.
@@ -69,7 +97,13 @@ class WM_OT_hydroponics_generator(Operator):
         # The socket extends from tee_arm_core_length to tee_arm_core_length + tee_socket_length.
         # The pipe should connect at tee_arm_core_length + pipe_insertion_depth.
 
-        for c in range(layout.columns - 1):
+        # Column x / row y coordinates never change across the grid;
+        # compute them once and share the lists between the manifold
+        # loop and the pot loop.
+        col_x = [c * spacing_x for c in range(cols)]
+        row_y = [r * spacing_y for r in range(rows)]
+
+        for c in range(cols - 1):
             # For the inlet manifold
             # Start from the end of the previous tee's socket (or start of the first tee's socket)
             # End at the beginning of the next tee's socket (or end of the last tee's socket)
@@ -77,69 +111,89 @@ class WM_OT_hydroponics_generator(Operator):
             # The tee at c * layout.spacing_x has its right arm at c * layout.spacing_x + tee_arm_core_length + pipe_insertion_depth
             # The tee at (c+1) * layout.spacing_x has its left arm at (c+1) * layout.spacing_x - (tee_arm_core_length + pipe_insertion_depth)
             
-            x_start_manifold = c * layout.spacing_x + tee_arm_core_length + pipe_insertion_depth
-            x_end_manifold = (c + 1) * layout.spacing_x - (tee_arm_core_length + pipe_insertion_depth)
+            x_start_manifold = col_x[c] + arm_plus_ins
+            x_end_manifold = col_x[c + 1] - arm_plus_ins
+            x_mid_manifold = (x_start_manifold + x_end_manifold) / 2.0
+            segment_length = x_end_manifold - x_start_manifold
 
-            inlet_segment = pipe_gen.create(f"Manifold_Inlet_{c}", Vector((x_start_manifold, manifold_y_in, pipe_z)), Vector((x_end_manifold, manifold_y_in, pipe_z)))
-            outlet_segment = pipe_gen.create(f"Manifold_Outlet_{c}", Vector((x_start_manifold, manifold_y_out, pipe_z)), Vector((x_end_manifold, manifold_y_out, pipe_z)))
+            # Manifold segments run along world X; the axis-aligned fast
+            # path skips the per-pipe orientation math.
+            inlet_segment = pipe_gen.create_axis(f"Manifold_Inlet_{c}", Vector((x_mid_manifold, manifold_y_in, pipe_z)), segment_length, axis='X')
+            outlet_segment = pipe_gen.create_axis(f"Manifold_Outlet_{c}", Vector((x_mid_manifold, manifold_y_out, pipe_z)), segment_length, axis='X')
             pipe_gen._link_to_collection(inlet_segment, pipes_collection)
             pipe_gen._link_to_collection(outlet_segment, pipes_collection)
 
         # --- Create Pots and Connecting Pipes ---
-        for r in range(layout.rows):
-            for c in range(layout.columns):
-                loc_x = c * layout.spacing_x
-                loc_y = r * layout.spacing_y
+        # Elbow socket and pot rim offsets are the same for every pot
+        # (all pots share one volume); build the Vectors once instead of
+        # once per iteration.
+        elbow_socket_in = Vector((0, -arm_plus_ins, 0))
+        elbow_socket_out = Vector((0, arm_plus_ins, 0))
+        pot_rim_in = Vector((0, -pot_radius, 0))
+        pot_rim_out = Vector((0, pot_radius, 0))
+        # Bind the per-pot methods once; CPython re-resolves instance
+        # attributes on every call otherwise. _link_to_collection queues
+        # into shared class state, so one bound reference serves all
+        # generators.
+        pot_create = pot_gen.create
+        elbow_create = elbow_gen.create
+        pipe_create_axis = pipe_gen.create_axis
+        queue_link = pot_gen._link_to_collection
+        for r in range(rows):
+            for c in range(cols):
+                loc_x = col_x[c]
+                loc_y = row_y[r]
                 pot_loc = Vector((loc_x, loc_y, pot_height / 2.0))
-                pot_obj, _, pot_rad = pot_gen.create(f"Pot_{r}_{c}", pot_loc, pot_volume)
-                pot_gen._link_to_collection(pot_obj, pots_collection)
+                pot_obj, _, _ = pot_create(f"Pot_{r}_{c}", pot_loc, pot_volume)
+                queue_link(pot_obj, pots_collection)
 
                 # Inlet pipe from manifold to pot (using Elbow)
                 elbow_in_loc = Vector((loc_x, manifold_y_in, pipe_z))
                 # The elbow connects +X and +Y. For inlet, we need it to connect from manifold (along X) to pot (along -Y).
                 # So, rotate it by -90 degrees around Z to align +Y with -Y.
-                elbow_in = elbow_gen.create(f"Elbow_Inlet_{r}_{c}", elbow_in_loc, (0,0,math.radians(-90)))
+                elbow_in = elbow_create(f"Elbow_Inlet_{r}_{c}", elbow_in_loc, _ROT_ZN90)
                 
                 # Pipe starts from the elbow's -Y socket (which is now aligned with manifold_y_in)
                 # and connects to the pot.
-                pipe_start_loc_in = elbow_in_loc + Vector((0, -(tee_arm_core_length + pipe_insertion_depth), 0))
-                pipe_end_loc_in = pot_loc + Vector((0, -pot_rad, 0))
+                pipe_start_loc_in = elbow_in_loc + elbow_socket_in
+                pipe_end_loc_in = pot_loc + pot_rim_in
                 pipe_end_loc_in.z = pipe_z # Ensure pipe is at the correct Z height
-                pipe_in = pipe_gen.create(f"Pipe_Inlet_{r}_{c}", pipe_start_loc_in, pipe_end_loc_in)
-                elbow_gen._link_to_collection(elbow_in, pipes_collection)
-                pipe_gen._link_to_collection(pipe_in, pipes_collection)
+                pipe_in = pipe_create_axis(f"Pipe_Inlet_{r}_{c}", (pipe_start_loc_in + pipe_end_loc_in) / 2.0, pipe_end_loc_in.y - pipe_start_loc_in.y)
+                queue_link(elbow_in, pipes_collection)
+                queue_link(pipe_in, pipes_collection)
                 
                 # Outlet pipe from pot to manifold (using Elbow)
                 elbow_out_loc = Vector((loc_x, manifold_y_out, pipe_z))
                 # The elbow connects +X and +Y. For outlet, we need it to connect from pot (along +Y) to manifold (along X).
                 # So, rotate it by 90 degrees around Z to align +Y with +Y.
-                elbow_out = elbow_gen.create(f"Elbow_Outlet_{r}_{c}", elbow_out_loc, (0,0,math.radians(90)))
+                elbow_out = elbow_create(f"Elbow_Outlet_{r}_{c}", elbow_out_loc, _ROT_Z90)
                 
                 # Pipe starts from the pot and connects to the elbow's +Y socket
-                pipe_start_loc_out = pot_loc + Vector((0, pot_rad, 0))
+                pipe_start_loc_out = pot_loc + pot_rim_out
                 pipe_start_loc_out.z = pipe_z # Ensure pipe is at the correct Z height
-                pipe_end_loc_out = elbow_out_loc + Vector((0, (tee_arm_core_length + pipe_insertion_depth), 0))
-                pipe_out = pipe_gen.create(f"Pipe_Outlet_{r}_{c}", pipe_start_loc_out, pipe_end_loc_out)
-                elbow_gen._link_to_collection(elbow_out, pipes_collection)
-                pipe_gen._link_to_collection(pipe_out, pipes_collection)
+                pipe_end_loc_out = elbow_out_loc + elbow_socket_out
+                pipe_out = pipe_create_axis(f"Pipe_Outlet_{r}_{c}", (pipe_start_loc_out + pipe_end_loc_out) / 2.0, pipe_end_loc_out.y - pipe_start_loc_out.y)
+                queue_link(elbow_out, pipes_collection)
+                queue_link(pipe_out, pipes_collection)
 
         # --- Create Balance Tank ---
         center_x = grid_width / 2.0
-        balance_y = manifold_y_out - layout.spacing_y
+        balance_y = manifold_y_out - spacing_y
         balance_loc = Vector((center_x, balance_y, pot_height / 2.0))
         balance_tank, _, _ = pot_gen.create("Balance_Tank", balance_loc, pot_volume)
         pot_gen._link_to_collection(balance_tank, pots_collection)
 
-        # Connect manifolds to the balance tank location
-        pipe_in_to_balance = pipe_gen.create("Pipe_ManifoldInlet_Balance", Vector((center_x, manifold_y_in, pipe_z)), balance_loc.xy.to_3d() + Vector((0,0,pipe_z)))
-        pipe_out_from_balance = pipe_gen.create("Pipe_ManifoldOutlet_Balance", balance_loc.xy.to_3d() + Vector((0,0,pipe_z)), Vector((center_x, manifold_y_out, pipe_z)))
+        # Connect manifolds to the balance tank location; both runs are
+        # straight along world Y at pipe height.
+        pipe_in_to_balance = pipe_gen.create_axis("Pipe_ManifoldInlet_Balance", Vector((center_x, (manifold_y_in + balance_y) / 2.0, pipe_z)), balance_y - manifold_y_in)
+        pipe_out_from_balance = pipe_gen.create_axis("Pipe_ManifoldOutlet_Balance", Vector((center_x, (balance_y + manifold_y_out) / 2.0, pipe_z)), manifold_y_out - balance_y)
         pipe_gen._link_to_collection(pipe_in_to_balance, pipes_collection)
         pipe_gen._link_to_collection(pipe_out_from_balance, pipes_collection)
 
         # --- Create Main Reservoir (Optional) ---
         if scene_props.enable_reservoir:
             reservoir_volume = float(scene_props.reservoir_props.volume)
-            reservoir_loc = Vector((center_x, balance_y - layout.spacing_y, 0))
+            reservoir_loc = Vector((center_x, balance_y - spacing_y, 0))
             reservoir, res_h, _ = pot_gen.create("Main_Reservoir", reservoir_loc, reservoir_volume)
             reservoir.location.z = res_h / 2.0
             pot_gen._link_to_collection(reservoir, pots_collection)
@@ -150,43 +204,81 @@ class WM_OT_hydroponics_generator(Operator):
             pipe_gen._link_to_collection(pipe_res_to_balance, pipes_collection)
             pipe_gen._link_to_collection(pipe_balance_to_res, pipes_collection)
 
+        # Flush all queued collection moves in one batch before finalizing
+        mesh_creator.MeshGenerator.flush_links()
+
         # --- Finalize Model: Join and Optimize ---
         if scene_props.create_connections:
-            all_objects = [obj for obj in list(pots_collection.objects) + list(pipes_collection.objects) if obj is not None]
+            # collection.objects never yields None or dangling references
+            # for objects we just created ourselves; no validity filter
+            # is needed. Unpack straight into one list (it is iterated
+            # several times and fed to batch_remove) without building
+            # two intermediate lists first.
+            all_objects = [*pots_collection.objects, *pipes_collection.objects]
             if not all_objects:
                 return {'FINISHED'}
-            
-            # Apply all modifiers before joining
-            for obj in all_objects:
-                if obj.type == 'MESH' and obj.modifiers:
-                    bpy.context.view_layer.objects.active = obj
-                    for mod in list(obj.modifiers):
-                        bpy.ops.object.modifier_apply(modifier=mod.name)
 
-            # Select all objects and join them
-            bpy.ops.object.select_all(action='DESELECT')
+            # Every object above was placed through location/rotation/
+            # scale with no depsgraph evaluation since, so matrix_world
+            # is still stale (identity). One view-layer update makes the
+            # matrices current before the merge bakes them in.
+            context.view_layer.update()
+
+
+            # Apply all modifiers before joining. One evaluated-depsgraph
+            # pass bakes every modifier stack at once, instead of one
+            # modifier_apply operator dispatch (context resolve plus
+            # depsgraph update) per modifier.
+            mod_objects = [obj for obj in all_objects if obj.type == 'MESH' and obj.modifiers]
+            if mod_objects:
+                depsgraph = context.evaluated_depsgraph_get()
+                for obj in mod_objects:
+                    eval_obj = obj.evaluated_get(depsgraph)
+                    baked = bpy.data.meshes.new_from_object(eval_obj)
+                    obj.modifiers.clear()
+                    obj.data = baked
+
+            # Merge everything through one bmesh instead of select-all +
+            # bpy.ops.object.join() + an Edit-mode remove_doubles. This
+            # runs with no operator dispatches, no selection churn and no
+            # mode switches, and it reads the shared template meshes
+            # without mutating them the way join mutates the active
+            # object's datablock.
+            bm = bmesh.new()
             for obj in all_objects:
-                obj.select_set(True)
+                if obj.type != 'MESH':
+                    continue
+                offset = len(bm.verts)
+                bm.from_mesh(obj.data)
+                bm.verts.ensure_lookup_table()
+                bmesh.ops.transform(bm, matrix=obj.matrix_world, verts=bm.verts[offset:])
+            # Geometry cleanup is what optimize_model opts into; when it
+            # is off the merge keeps every vertex as generated.
+            if scene_props.optimize_model:
+                bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.001)
+                # Welding can leave faces from different sources with
+                # inconsistent winding; fix them in the same bmesh pass.
+                bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
 
-            if bpy.context.selected_objects:
-                bpy.context.view_layer.objects.active = all_objects[0]
-                bpy.ops.object.join()
-                
-                final_system = bpy.context.active_object
-                
-                # Clean up geometry
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.select_all(action='SELECT')
-                bpy.ops.mesh.remove_doubles(threshold=0.001)
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                # Optimize final mesh appearance
-                if scene_props.optimize_model:
-                    bpy.context.view_layer.objects.active = final_system
-                    bpy.ops.object.shade_smooth()
-
-                # Move the final joined object to the 'System' collection
-                pot_gen._link_to_collection(final_system, system_collection)
+            system_mesh = bpy.data.meshes.new("RDWC_System")
+            bm.to_mesh(system_mesh)
+            bm.free()
+            final_system = bpy.data.objects.new("RDWC_System", system_mesh)
+
+            # The source objects are no longer needed; drop them in one
+            # depsgraph flush.
+            bpy.data.batch_remove(ids=tuple(all_objects))
+
+            # Optimize final mesh appearance: foreach_set fills the whole
+            # use_smooth flag array in one C-level pass instead of one
+            # RNA write per polygon.
+            if scene_props.optimize_model:
+                polygons = final_system.data.polygons
+                polygons.foreach_set("use_smooth", [True] * len(polygons))
+
+            # Move the final joined object to the 'System' collection
+            pot_gen._link_to_collection(final_system, system_collection)
+            mesh_creator.MeshGenerator.flush_links()
 
         self.report({'INFO'}, "RDWC Manifold System Generated")
         return {'FINISHED'}
@@ -12,11 +12,17 @@ from bpy.types import PropertyGroup
 # ADDON PROPERTIES
 # =================================================================================================
 
+# Static enum items, interned once at import instead of one throwaway
+# list per property declaration.
+_POT_VOLUME_ITEMS = (('10.0', "10L", ""), ('19.0', "19L", ""), ('25.0', "25L", ""))
+_RESERVOIR_VOLUME_ITEMS = (('50.0', "50L", ""), ('75.0', "75L", ""), ('100.0', "100L", ""))
+_PIPE_STANDARD_ITEMS = (('TR', "Turkish PVC (mm)", ""), ('METRIC', "Metric (mm)", ""))
+
 class HydroponicsPotProperties(PropertyGroup):
     """Properties for the hydroponic pots."""
     volume: EnumProperty(
         name="Bucket Volume",
-        items=[('10.0', "10L", ""), ('19.0', "19L", ""), ('25.0', "25L", "")],
+        items=_POT_VOLUME_ITEMS,
         default='25.0'
     )
 
@@ -24,22 +30,25 @@ class HydroponicsReservoirProperties(PropertyGroup):
     """Properties for the main reservoir."""
     volume: EnumProperty(
         name="Reservoir Volume",
-        items=[('50.0', "50L", ""), ('75.0', "75L", ""), ('100.0', "100L", "")],
+        items=_RESERVOIR_VOLUME_ITEMS,
         default='75.0'
     )
 
+# Enum items callbacks run on every dropdown redraw and tooltip query,
+# so the two static size lists are built once here instead of per call.
+# The module references also keep the item strings alive for Blender.
+_TR_PIPE_SIZES = (('20', "20mm", ""), ('25', "25mm", ""), ('32', "32mm", ""), ('50', "50mm", ""))
+_METRIC_PIPE_SIZES = (('15', "15mm", ""), ('20', "20mm", ""), ('25', "25mm", ""), ('40', "40mm", ""), ('50', "50mm", ""))
+
 def get_pipe_sizes(self, context):
-    """Dynamically returns pipe sizes based on the selected standard."""
-    if self.pipe_standard == 'TR':
-        return [('20', "20mm", ""), ('25', "25mm", ""), ('32', "32mm", ""), ('50', "50mm", "")]
-    else:  # METRIC
-        return [('15', "15mm", ""), ('20', "20mm", ""), ('25', "25mm", ""), ('40', "40mm", ""), ('50', "50mm", "")]
+    """Returns the pipe sizes for the selected standard."""
+    return _TR_PIPE_SIZES if self.pipe_standard == 'TR' else _METRIC_PIPE_SIZES
 
 class HydroponicsPipeProperties(PropertyGroup):
     """Properties for the pipes."""
     pipe_standard: EnumProperty(
         name="Pipe Standard",
-        items=[('TR', "Turkish PVC (mm)", ""), ('METRIC', "Metric (mm)", "")],
+        items=_PIPE_STANDARD_ITEMS,
         default='TR',
         description="Select the pipe standard to use"
     )
@@ -79,10 +88,6 @@ classes = (
     HydroponicsSystemProperties,
 )
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+# Blender's factory registers/unregisters the tuple in one pass and
+# keeps the two functions trivially in sync.
+register, unregister = bpy.utils.register_classes_factory(classes)
@@ -2,7 +2,7 @@ import bpy
 from bpy.types import Panel
 
 # =================================================================================================
-# UI PANEL
+# UI PANELS
 # =================================================================================================
 
 class VIEW3D_PT_hydroponics_generator(Panel):
@@ -12,53 +12,100 @@ class VIEW3D_PT_hydroponics_generator(Panel):
     bl_category = "Hydroponics"
     bl_label = "RDWC System Generator"
 
+    @classmethod
+    def poll(cls, context):
+        # Skip the whole panel tree (sub-panels included) while the
+        # addon's properties are not attached, e.g. mid-reload.
+        return hasattr(context.scene, "hydroponics_props")
+
     def draw(self, context):
+        self.layout.operator("wm.hydroponics_generator", text="Generate System", icon='MOD_BUILD')
+
+class _HydroponicsSubPanel:
+    """Mix-in shared by the collapsible sections below.
+
+    Blender does not call draw() on collapsed sub-panels at all, so a
+    section only costs redraw time while the user has it open.
+    """
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Hydroponics"
+    bl_parent_id = "VIEW3D_PT_hydroponics_generator"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def _settings_layout(self):
+        """Returns the panel layout configured for property rows.
+
+        use_property_split draws the standard two-column layout from
+        RNA-cached labels instead of measuring a label per prop row;
+        decorators (animation dots) are noise for generator settings.
+        """
         layout = self.layout
-        props = context.scene.hydroponics_props
-        layout_props = props.layout_props
-        pipe_props = props.pipe_props
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        return layout
+
+class VIEW3D_PT_hydroponics_layout(_HydroponicsSubPanel, Panel):
+    bl_label = "System Layout"
 
-        box = layout.box()
-        box.label(text="System Layout", icon='GRID')
-        row = box.row()
+    def draw(self, context):
+        layout = self._settings_layout()
+        layout_props = context.scene.hydroponics_props.layout_props
+        row = layout.row()
         row.prop(layout_props, "rows")
         row.prop(layout_props, "columns")
-        box.prop(layout_props, "spacing_x")
-        box.prop(layout_props, "spacing_y")
-
-        box = layout.box()
-        box.label(text="Pot Properties", icon='CUBE')
-        box.prop(props.pot_props, "volume")
-
-        box = layout.box()
-        box.label(text="Pipe Properties", icon='MOD_CURVE')
-        box.prop(pipe_props, "pipe_standard")
-        box.prop(pipe_props, "pipe_size")
-
-        box = layout.box()
-        box.label(text="Main Reservoir", icon='MOD_FLUID')
-        box.prop(props, "enable_reservoir")
-        if props.enable_reservoir:
-            box.prop(props.reservoir_props, "volume")
-
-        layout.separator()
-        box = layout.box()
-        box.label(text="Generation Options", icon='SETTINGS')
-        box.prop(props, "create_connections")
-        if props.create_connections:
-            box.prop(props, "optimize_model")
-
-        layout.separator()
-        layout.operator("wm.hydroponics_generator", text="Generate System", icon='MOD_BUILD')
+        layout.prop(layout_props, "spacing_x")
+        layout.prop(layout_props, "spacing_y")
+
+class VIEW3D_PT_hydroponics_pots(_HydroponicsSubPanel, Panel):
+    bl_label = "Pot Properties"
+
+    def draw(self, context):
+        self._settings_layout().prop(context.scene.hydroponics_props.pot_props, "volume")
+
+class VIEW3D_PT_hydroponics_pipes(_HydroponicsSubPanel, Panel):
+    bl_label = "Pipe Properties"
+
+    def draw(self, context):
+        layout = self._settings_layout()
+        pipe_props = context.scene.hydroponics_props.pipe_props
+        layout.prop(pipe_props, "pipe_standard")
+        layout.prop(pipe_props, "pipe_size")
+
+class VIEW3D_PT_hydroponics_reservoir(_HydroponicsSubPanel, Panel):
+    bl_label = "Main Reservoir"
+
+    def draw(self, context):
+        layout = self._settings_layout()
+        props = context.scene.hydroponics_props
+        layout.prop(props, "enable_reservoir")
+        # Draw the volume row unconditionally and grey it out instead of
+        # changing the layout tree shape on toggle; a stable topology
+        # lets Blender reuse its layout measurements.
+        sub = layout.column()
+        sub.active = props.enable_reservoir
+        sub.prop(props.reservoir_props, "volume")
+
+class VIEW3D_PT_hydroponics_generation(_HydroponicsSubPanel, Panel):
+    bl_label = "Generation Options"
+
+    def draw(self, context):
+        layout = self._settings_layout()
+        props = context.scene.hydroponics_props
+        layout.prop(props, "create_connections")
+        sub = layout.column()
+        sub.active = props.create_connections
+        sub.prop(props, "optimize_model")
 
 classes = (
     VIEW3D_PT_hydroponics_generator,
+    VIEW3D_PT_hydroponics_layout,
+    VIEW3D_PT_hydroponics_pots,
+    VIEW3D_PT_hydroponics_pipes,
+    VIEW3D_PT_hydroponics_reservoir,
+    VIEW3D_PT_hydroponics_generation,
 )
 
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+# Same factory pattern as properties.py: one-pass registration with the
+# pair kept trivially in sync.
+register, unregister = bpy.utils.register_classes_factory(classes)